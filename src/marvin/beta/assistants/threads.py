@@ -16,6 +16,8 @@ from marvin.utilities.pydantic import parse_as
 
 logger = get_logger("Threads")
 
+MAX_CONCURRENT_FILE_UPLOADS = 4
+
 if TYPE_CHECKING:
     from .assistants import Assistant
     from .runs import Run
@@ -62,17 +64,45 @@ class Thread(BaseModel, ExposeSyncMethodsMixin):
         if self.id is None:
             await self.create_async()
 
-        # Upload files and collect their IDs
-        file_ids = []
-        for file_path in file_paths or []:
-            with open(file_path, mode="rb") as file:
-                response = await client.files.create(file=file, purpose="assistants")
-                file_ids.append(response.id)
+        # Upload files concurrently (up to a limit) and collect their IDs
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_UPLOADS)
+
+        async def upload_file(file_path: str) -> str:
+            async with semaphore:
+                with open(file_path, mode="rb") as file:
+                    response = await client.files.create(
+                        file=file, purpose="assistants"
+                    )
+                    return response.id
+
+        uploads = [
+            asyncio.ensure_future(upload_file(file_path))
+            for file_path in file_paths or []
+        ]
+
+        try:
+            file_ids = await asyncio.gather(*uploads)
+
+            # Create the message with the attached files
+            response = await client.beta.threads.messages.create(
+                thread_id=self.id, role="user", content=message, file_ids=file_ids
+            )
+        except Exception:
+            # stop any uploads that haven't finished and delete the files that
+            # did upload so they aren't left orphaned
+            for upload in uploads:
+                upload.cancel()
+            await asyncio.gather(*uploads, return_exceptions=True)
+            await asyncio.gather(
+                *[
+                    client.files.delete(upload.result())
+                    for upload in uploads
+                    if not upload.cancelled() and upload.exception() is None
+                ],
+                return_exceptions=True,
+            )
+            raise
 
-        # Create the message with the attached files
-        response = await client.beta.threads.messages.create(
-            thread_id=self.id, role="user", content=message, file_ids=file_ids
-        )
         return ThreadMessage.model_validate(response.model_dump())
 
     @expose_sync_method("get_messages")
@@ -23,7 +23,6 @@ from typing_extensions import ParamSpec, Self
 
 from marvin.components.prompt import PromptFunction
 from marvin.serializers import create_vocabulary_from_type
-from marvin.settings import settings
 from marvin.utilities.jinja import (
     BaseEnvironment,
 )
@@ -51,7 +50,7 @@ class AIClassifier(BaseModel, Generic[P, T]):
         )
     )
     enumerate: bool = True
-    encoder: Callable[[str], list[int]] = Field(default=None)
+    encoder: Optional[Callable[[str], list[int]]] = Field(default=None)
     max_tokens: Optional[int] = 1
     render_kwargs: dict[str, Any] = Field(default_factory=dict)
 
@@ -115,7 +114,7 @@ class AIClassifier(BaseModel, Generic[P, T]):
         environment: Optional[BaseEnvironment] = None,
         prompt: Optional[str] = None,
         enumerate: bool = True,
-        encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+        encoder: Optional[Callable[[str], list[int]]] = None,
         max_tokens: Optional[int] = 1,
         acreate: Optional[Callable[..., Awaitable[Any]]] = None,
         **render_kwargs: Any,
@@ -131,7 +130,7 @@ class AIClassifier(BaseModel, Generic[P, T]):
         environment: Optional[BaseEnvironment] = None,
         prompt: Optional[str] = None,
         enumerate: bool = True,
-        encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+        encoder: Optional[Callable[[str], list[int]]] = None,
         max_tokens: Optional[int] = 1,
         acreate: Optional[Callable[..., Awaitable[Any]]] = None,
         **render_kwargs: Any,
@@ -146,7 +145,7 @@ class AIClassifier(BaseModel, Generic[P, T]):
         environment: Optional[BaseEnvironment] = None,
         prompt: Optional[str] = None,
         enumerate: bool = True,
-        encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+        encoder: Optional[Callable[[str], list[int]]] = None,
         max_tokens: Optional[int] = 1,
         acreate: Optional[Callable[..., Awaitable[Any]]] = None,
         **render_kwargs: Any,
@@ -181,7 +180,7 @@ def ai_classifier(
     environment: Optional[BaseEnvironment] = None,
     prompt: Optional[str] = None,
     enumerate: bool = True,
-    encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+    encoder: Optional[Callable[[str], list[int]]] = None,
     max_tokens: Optional[int] = 1,
     **render_kwargs: Any,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
@@ -195,7 +194,7 @@ def ai_classifier(
     environment: Optional[BaseEnvironment] = None,
     prompt: Optional[str] = None,
     enumerate: bool = True,
-    encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+    encoder: Optional[Callable[[str], list[int]]] = None,
     max_tokens: Optional[int] = 1,
     **render_kwargs: Any,
 ) -> Callable[P, T]:
@@ -208,7 +207,7 @@ def ai_classifier(
     environment: Optional[BaseEnvironment] = None,
     prompt: Optional[str] = None,
     enumerate: bool = True,
-    encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+    encoder: Optional[Callable[[str], list[int]]] = None,
     max_tokens: Optional[int] = 1,
     **render_kwargs: Any,
 ) -> Union[Callable[[Callable[P, T]], Callable[P, T]], Callable[P, T]]:
@@ -21,7 +21,6 @@ from marvin.serializers import (
     create_tool_from_type,
     create_vocabulary_from_type,
 )
-from marvin.settings import settings
 from marvin.utilities.jinja import (
     BaseEnvironment,
     Transcript,
@@ -46,7 +45,7 @@ class PromptFunction(Prompt[U]):
         environment: Optional[BaseEnvironment] = None,
         prompt: Optional[str] = None,
         enumerate: bool = True,
-        encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+        encoder: Optional[Callable[[str], list[int]]] = None,
         max_tokens: Optional[int] = 1,
     ) -> Callable[[Callable[P, Any]], Callable[P, Self]]:
         pass
@@ -60,7 +59,7 @@ class PromptFunction(Prompt[U]):
         environment: Optional[BaseEnvironment] = None,
         prompt: Optional[str] = None,
         enumerate: bool = True,
-        encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+        encoder: Optional[Callable[[str], list[int]]] = None,
         max_tokens: Optional[int] = 1,
     ) -> Callable[P, Self]:
         pass
@@ -73,7 +72,7 @@ class PromptFunction(Prompt[U]):
         environment: Optional[BaseEnvironment] = None,
         prompt: Optional[str] = None,
         enumerate: bool = True,
-        encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+        encoder: Optional[Callable[[str], list[int]]] = None,
         max_tokens: Optional[int] = 1,
         **kwargs: Any,
     ) -> Union[Callable[[Callable[P, Any]], Callable[P, Self]], Callable[P, Self],]:
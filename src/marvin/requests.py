@@ -78,7 +78,7 @@ class ResponseModel(BaseModel):
 
 
 class ChatRequest(Prompt[T]):
-    model: str = Field(default=settings.openai.chat.completions.model)
+    model: str = Field(default_factory=lambda: settings.openai.chat.completions.model)
     frequency_penalty: Optional[
         Annotated[float, Field(strict=True, ge=-2.0, le=2.0)]
     ] = 0
@@ -1,4 +1,6 @@
+import copy
 from enum import Enum
+from functools import lru_cache
 from types import GenericAlias
 from typing import (
     Any,
@@ -37,6 +39,39 @@ def create_tool_from_type(
     python_function: Optional[Callable[..., Any]] = None,
     **kwargs: Any,
 ) -> Tool[BaseModel]:
+    try:
+        hash(_type)
+        create = _create_model_and_schema_from_type
+    except TypeError:
+        # unhashable types (e.g. Annotated with unhashable metadata) can't be
+        # memoized, so build the model directly
+        create = _create_model_and_schema_from_type.__wrapped__
+
+    model, parameters = create(_type, model_name, field_name, field_description)
+    return Tool[BaseModel](
+        type="function",
+        function=Function[BaseModel](
+            name=model_name,
+            description=model_description,
+            # the cached schema is shared, so hand each tool its own copy
+            parameters=copy.deepcopy(parameters),
+            model=model,
+        ),
+    )
+
+
+@lru_cache(maxsize=256)
+def _create_model_and_schema_from_type(
+    _type: Union[type, GenericAlias],
+    model_name: str,
+    field_name: str,
+    field_description: str,
+) -> tuple[type[BaseModel], dict[str, Any]]:
+    """
+    This function is memoized because the same return type is turned into a
+    tool once to build the prompt and again to parse every response, and
+    creating the model and its JSON schema dominates the cost of both.
+    """
     annotated_metadata = getattr(_type, "__metadata__", [])
     if isinstance(next(iter(annotated_metadata), None), FieldInfo):
         metadata = next(iter(annotated_metadata))
@@ -52,15 +87,7 @@ def create_tool_from_type(
         __cls_kwargs__=None,
         **{field_name: (_type, metadata)},
     )
-    return Tool[BaseModel](
-        type="function",
-        function=Function[BaseModel](
-            name=model_name,
-            description=model_description,
-            parameters=model.model_json_schema(schema_generator=FunctionSchema),
-            model=model,
-        ),
-    )
+    return model, model.model_json_schema(schema_generator=FunctionSchema)
 
 
 def create_vocabulary_from_type(
@@ -81,11 +108,13 @@ def create_vocabulary_from_type(
 
 def create_grammar_from_vocabulary(
     vocabulary: list[str],
-    encoder: Callable[[str], list[int]] = settings.openai.chat.completions.encoder,
+    encoder: Optional[Callable[[str], list[int]]] = None,
     max_tokens: Optional[int] = None,
     _enumerate: bool = True,
     **kwargs: Any,
 ) -> Grammar:
+    if encoder is None:
+        encoder = settings.openai.chat.completions.encoder
     return Grammar(
         max_tokens=max_tokens,
         logit_bias={
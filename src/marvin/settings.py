@@ -170,35 +170,39 @@ class OpenAISettings(MarvinSettings):
     assistants: AssistantSettings = Field(default_factory=AssistantSettings)
 
     @property
-    def async_client(
-        self, api_key: Optional[str] = None, **kwargs: Any
-    ) -> "AsyncClient":
-        from openai import AsyncClient
+    def async_client(self) -> "AsyncClient":
+        import asyncio
 
-        if not (api_key or self.api_key):
+        from marvin.utilities.openai import _get_client_memoized
+
+        if not self.api_key:
             raise ValueError("No API key provided.")
-        elif not api_key and self.api_key:
-            api_key = self.api_key.get_secret_value()
+        api_key = self.api_key.get_secret_value()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # outside of a running loop there is no loop to key the client on,
+            # so return a fresh client rather than one that may be shared
+            # across loops
+            return _get_client_memoized.__wrapped__(
+                api_key=api_key, organization=self.organization
+            )
 
-        return AsyncClient(
-            api_key=api_key,
-            organization=self.organization,
-            **kwargs,
+        return _get_client_memoized(
+            api_key=api_key, organization=self.organization, loop=loop
         )
 
     @property
-    def client(self, api_key: Optional[str] = None, **kwargs: Any) -> "Client":
-        from openai import Client
+    def client(self) -> "Client":
+        from marvin.utilities.openai import _get_sync_client_memoized
 
-        if not (api_key or self.api_key):
+        if not self.api_key:
             raise ValueError("No API key provided.")
-        elif not api_key and self.api_key:
-            api_key = self.api_key.get_secret_value()
+        api_key = self.api_key.get_secret_value()
 
-        return Client(
-            api_key=api_key,
-            organization=self.organization,
-            **kwargs,
+        return _get_sync_client_memoized(
+            api_key=api_key, organization=self.organization
         )
 
 
@@ -2,7 +2,7 @@ import asyncio
 from functools import lru_cache
 from typing import Optional
 
-from openai import AsyncClient
+from openai import AsyncClient, Client
 
 
 def get_client() -> AsyncClient:
@@ -17,7 +17,7 @@ def get_client() -> AsyncClient:
     )
 
 
-@lru_cache
+@lru_cache(maxsize=8)
 def _get_client_memoized(
     api_key: Optional[str],
     organization: Optional[str],
@@ -31,8 +31,29 @@ def _get_client_memoized(
     across multiple event loops (which can happen when using the `run_sync`
     function). Attempting to re-use the client across multiple event loops
     can result in a `RuntimeError: Event loop is closed` error or infinite hangs.
+
+    The cache is kept small because every `run_sync` call runs on a new loop,
+    so entries for finished loops are never hit again. Bounding the cache lets
+    those clients (and their loops) be released, at the cost of rebuilding a
+    client when more than a few loops are alive at once.
     """
     return AsyncClient(
         api_key=api_key,
         organization=organization,
     )
+
+
+@lru_cache
+def _get_sync_client_memoized(
+    api_key: Optional[str],
+    organization: Optional[str],
+) -> Client:
+    """
+    This function is memoized to ensure that only one instance of the sync client
+    is created for a given api key / organization pair, so that its connection
+    pool is reused across requests.
+    """
+    return Client(
+        api_key=api_key,
+        organization=organization,
+    )
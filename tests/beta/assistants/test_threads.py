@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from marvin.beta.assistants import threads
+from marvin.beta.assistants.threads import MAX_CONCURRENT_FILE_UPLOADS, Thread
+
+
+class StubClient:
+    def __init__(self, fail_on: str = None, fail_message: bool = False):
+        self.fail_on = fail_on
+        self.fail_message = fail_message
+        self.active_uploads = 0
+        self.peak_uploads = 0
+        self.started = []
+        self.created = []
+        self.deleted = []
+        self.message_file_ids = None
+        self.files = SimpleNamespace(create=self.create_file, delete=self.delete_file)
+        self.beta = SimpleNamespace(
+            threads=SimpleNamespace(
+                messages=SimpleNamespace(create=self.create_message)
+            )
+        )
+
+    async def create_file(self, file, purpose):
+        name = file.name.rsplit("/", 1)[-1]
+        self.started.append(name)
+        self.active_uploads += 1
+        self.peak_uploads = max(self.peak_uploads, self.active_uploads)
+        try:
+            # finish uploads in reverse order to check that ids keep their order
+            await asyncio.sleep(0.01 * (20 - int(name)))
+            if name == self.fail_on:
+                raise RuntimeError(f"upload failed: {name}")
+            self.created.append(name)
+            return SimpleNamespace(id=name)
+        finally:
+            self.active_uploads -= 1
+
+    async def delete_file(self, file_id):
+        self.deleted.append(file_id)
+
+    async def create_message(self, thread_id, role, content, file_ids):
+        if self.fail_message:
+            raise RuntimeError("message failed")
+        self.message_file_ids = file_ids
+        return SimpleNamespace(
+            model_dump=lambda: dict(
+                id="msg_1",
+                object="thread.message",
+                created_at=0,
+                thread_id=thread_id,
+                role=role,
+                content=[],
+                file_ids=file_ids,
+                metadata={},
+            )
+        )
+
+
+@pytest.fixture
+def file_paths(tmp_path):
+    paths = []
+    for i in range(10):
+        path = tmp_path / str(i)
+        path.write_text(str(i))
+        paths.append(str(path))
+    return paths
+
+
+class TestAddFiles:
+    async def test_uploads_are_capped_and_ordered(self, monkeypatch, file_paths):
+        client = StubClient()
+        monkeypatch.setattr(threads, "get_client", lambda: client)
+
+        await Thread(id="thread_1").add_async("hello", file_paths=file_paths)
+
+        assert client.peak_uploads == MAX_CONCURRENT_FILE_UPLOADS
+        assert client.message_file_ids == [str(i) for i in range(10)]
+
+    async def test_failed_upload_deletes_uploaded_files(self, monkeypatch, file_paths):
+        # file 0 is the slowest of the first batch, so files 1-3 finish
+        # before it fails while the rest are still in flight or waiting
+        client = StubClient(fail_on="0")
+        monkeypatch.setattr(threads, "get_client", lambda: client)
+
+        with pytest.raises(RuntimeError, match="upload failed: 0"):
+            await Thread(id="thread_1").add_async("hello", file_paths=file_paths)
+
+        assert sorted(client.created) == ["1", "2", "3"]
+        assert sorted(client.deleted) == ["1", "2", "3"]
+        # uploads still waiting on the semaphore are cancelled, not started
+        assert not {"8", "9"} & set(client.started)
+
+    async def test_failed_message_deletes_uploaded_files(self, monkeypatch, file_paths):
+        client = StubClient(fail_message=True)
+        monkeypatch.setattr(threads, "get_client", lambda: client)
+
+        with pytest.raises(RuntimeError, match="message failed"):
+            await Thread(id="thread_1").add_async("hello", file_paths=file_paths)
+
+        assert sorted(client.deleted) == sorted(client.created)
+        assert len(client.deleted) == len(file_paths)
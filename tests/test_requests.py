@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+from marvin.requests import ChatRequest
+from marvin.settings import settings
+
+
+def test_chat_request_model_follows_settings(monkeypatch):
+    monkeypatch.setattr(settings.openai.chat.completions, "model", "gpt-4")
+    assert ChatRequest().model == "gpt-4"
+
+
+def test_import_does_not_load_encoder():
+    code = (
+        "import tiktoken\n"
+        "def fail(*args, **kwargs):\n"
+        "    raise AssertionError('encoder loaded at import time')\n"
+        "tiktoken.encoding_for_model = fail\n"
+        "import marvin\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,41 @@
+from typing import Annotated
+
+from marvin.serializers import create_tool_from_type
+
+
+def create_tool(_type, field_description="The data to format."):
+    return create_tool_from_type(
+        _type=_type,
+        model_name="FormatResponse",
+        model_description="Formats the response.",
+        field_name="data",
+        field_description=field_description,
+    )
+
+
+class TestCreateToolFromType:
+    def test_same_arguments_reuse_model(self):
+        tool_1 = create_tool(list[int])
+        tool_2 = create_tool(list[int])
+        assert tool_1.function.model is tool_2.function.model
+
+    def test_different_field_description_creates_new_model(self):
+        tool_1 = create_tool(list[int], field_description="first")
+        tool_2 = create_tool(list[int], field_description="second")
+        assert tool_1.function.model is not tool_2.function.model
+        assert (
+            tool_2.function.parameters["properties"]["data"]["description"] == "second"
+        )
+
+    def test_parameters_are_not_shared(self):
+        tool_1 = create_tool(list[int])
+        tool_1.function.parameters["properties"]["data"]["description"] = "mutated"
+        tool_2 = create_tool(list[int])
+        assert (
+            tool_2.function.parameters["properties"]["data"]["description"]
+            == "The data to format."
+        )
+
+    def test_unhashable_type_is_built_without_cache(self):
+        tool = create_tool(Annotated[int, {}])
+        assert tool.function.model.model_validate({"data": 1}).data == 1
@@ -1,4 +1,8 @@
-from marvin.settings import AssistantSettings, Settings, SpeechSettings
+import asyncio
+
+import pytest
+from marvin.settings import AssistantSettings, OpenAISettings, Settings, SpeechSettings
+from marvin.utilities import openai as marvin_openai
 from pydantic_settings import SettingsConfigDict
 
 
@@ -39,3 +43,67 @@ class TestAssistantSettings:
     def test_assistant_settings_default(self):
         settings = AssistantSettings()
         assert settings.model == "gpt-4-1106-preview"
+
+
+class StubClient:
+    def __init__(self, api_key=None, organization=None):
+        self.api_key = api_key
+        self.organization = organization
+
+
+class TestOpenAIClients:
+    @pytest.fixture(autouse=True)
+    def stub_clients(self, monkeypatch):
+        monkeypatch.setattr(marvin_openai, "AsyncClient", StubClient)
+        monkeypatch.setattr(marvin_openai, "Client", StubClient)
+        marvin_openai._get_client_memoized.cache_clear()
+        marvin_openai._get_sync_client_memoized.cache_clear()
+        yield
+        marvin_openai._get_client_memoized.cache_clear()
+        marvin_openai._get_sync_client_memoized.cache_clear()
+
+    def test_clients_require_api_key(self):
+        settings = OpenAISettings(api_key=None)
+        with pytest.raises(ValueError, match="No API key provided"):
+            settings.client
+        with pytest.raises(ValueError, match="No API key provided"):
+            settings.async_client
+
+    def test_client_is_reused(self):
+        settings = OpenAISettings(api_key="test_api_key_1")
+        assert settings.client is settings.client
+
+    def test_client_differs_by_api_key(self):
+        client_1 = OpenAISettings(api_key="test_api_key_1").client
+        client_2 = OpenAISettings(api_key="test_api_key_2").client
+        assert client_1 is not client_2
+        assert client_2.api_key == "test_api_key_2"
+
+    def test_async_client_is_reused_within_a_loop(self):
+        settings = OpenAISettings(api_key="test_api_key_1")
+
+        async def get_clients():
+            return settings.async_client, settings.async_client
+
+        client_1, client_2 = asyncio.run(get_clients())
+        assert client_1 is client_2
+
+    def test_async_client_differs_by_api_key(self):
+        async def get_clients():
+            return (
+                OpenAISettings(api_key="test_api_key_1").async_client,
+                OpenAISettings(api_key="test_api_key_2").async_client,
+            )
+
+        client_1, client_2 = asyncio.run(get_clients())
+        assert client_1 is not client_2
+
+    def test_async_client_without_running_loop(self):
+        settings = OpenAISettings(api_key="test_api_key_1")
+
+        async def noop():
+            pass
+
+        asyncio.run(noop())
+
+        assert settings.async_client.api_key == "test_api_key_1"